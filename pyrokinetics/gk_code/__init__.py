@@ -1,4 +1,4 @@
-from platform import python_version_tuple
+import sys
 
 from .cgyro import GKInputCGYRO, GKOutputReaderCGYRO  # noqa
 from .gene import GKInputGENE, GKOutputReaderGENE  # noqa
@@ -8,7 +8,7 @@ from .gk_input import GKInput, read_gk_input, supported_gk_input_types
 from .gk_output import GKOutput, read_gk_output, supported_gk_output_types
 
 # Only import IDS if Python version is greater than 3.9
-if tuple(int(x) for x in python_version_tuple()[:2]) >= (3, 9):
+if sys.version_info >= (3, 9):
     from .ids import GKOutputReaderIDS  # noqa
 
 __all__ = [
@@ -110,13 +110,19 @@ class LocalGeometry:
         setattr(self, key, value)
 
     def keys(self):
-        return self.__dict__.keys()
+        # Private attributes (caches etc.) are not part of the geometry
+        return [key for key in self.__dict__.keys() if not key.startswith("_")]
 
     def from_global_eq(
         self, eq: Equilibrium, psi_n: float, verbose=False, show_fit=False, **kwargs
     ):
         """
         Loads LocalGeometry object from an Equilibrium Object
+
+        Additional keyword arguments are passed to the fit of the shaping
+        coefficients, e.g. ``warm_start=True`` for LocalGeometryMXH. These are not
+        forwarded by ``Pyro.load_local_geometry``, so are only available when
+        calling this method directly
         """
         # TODO Currently stripping units from Equilibrium/FluxSurface. These should be
         # added in a later update.
@@ -1,11 +1,21 @@
+import math
+
 import numpy as np
-from typing import Tuple
-from scipy.optimize import least_squares  # type: ignore
-from scipy.integrate import simpson
+from typing import Optional, Tuple
 from .local_geometry import LocalGeometry
 from ..typing import ArrayLike
 from .local_geometry import default_inputs
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Below this many points the overhead of numexpr outweighs fusing the expression.
+# The grids used for fitting are smaller than this, so numexpr is only used when
+# derivatives are evaluated on dense user-supplied theta grids
+_NUMEXPR_MIN_SIZE = 4096
+
 
 def default_mxh_inputs():
     # Return default args to build a LocalGeometryMXH
@@ -130,7 +140,24 @@ class LocalGeometryMXH(LocalGeometry):
 
     """
 
+    n_moments = 4
+
     def __init__(self, *args, **kwargs):
+        # Harmonic numbers n and n^2 used when summing over moments
+        self._n_vec = np.arange(self.n_moments, dtype=np.float64)
+        self._n2_vec = self._n_vec**2
+
+        # Cache of cos(n theta), sin(n theta) tables keyed on the theta array
+        self._trig_cache = {}
+
+        # Result of the last b_poloidal fit, used as a warm start for the next one
+        self._fit_params = None
+
+        # Shape coefficients stored contiguously as rows (cn, sn, dcndr, dsndr)
+        self._coeffs = np.zeros((4, self.n_moments))
+        self.cn = np.zeros(self.n_moments)
+        self.sn = np.zeros(self.n_moments)
+
         s_args = list(args)
 
         if (
@@ -143,7 +170,9 @@ class LocalGeometryMXH(LocalGeometry):
         elif len(args) == 0:
             self.default()
 
-    def _set_shape_coefficients(self, R, Z, b_poloidal, verbose=False, shift=0.0):
+    def _set_shape_coefficients(
+        self, R, Z, b_poloidal, verbose=False, shift=0.0, warm_start=False
+    ):
         r"""
         Calculates MXH shaping coefficients from R, Z and b_poloidal
 
@@ -159,7 +188,15 @@ class LocalGeometryMXH(LocalGeometry):
             Controls verbosity
         shift : Float
             Initial guess for shafranov shift
+        warm_start : Boolean
+            Start the fit from the last fit made by this object rather than from
+            ``shift``. Only useful when fitting neighbouring flux surfaces of the
+            same equilibrium, and only set by passing it to ``from_global_eq``
         """
+        # Only needed when fitting, so SciPy is not imported with the module
+        from scipy.optimize import least_squares  # type: ignore
+
+        self._trig_cache.clear()
 
         kappa = (max(Z) - min(Z)) / (2 * self.r_minor)
 
@@ -172,43 +209,37 @@ class LocalGeometryMXH(LocalGeometry):
         normalised_height = (Z - Zmid) / (kappa * self.r_minor)
 
         # Floating point error can lead to >|1.0|
-        normalised_height = np.where(
-            np.isclose(normalised_height, 1.0), 1.0, normalised_height
-        )
-        normalised_height = np.where(
-            np.isclose(normalised_height, -1.0), -1.0, normalised_height
-        )
+        np.clip(normalised_height, -1.0, 1.0, out=normalised_height)
 
         theta = np.arcsin(normalised_height)
 
         normalised_radius = (R - self.Rmaj * self.a_minor) / self.r_minor
 
-        normalised_radius = np.where(
-            np.isclose(normalised_radius, 1.0, atol=1e-4), 1.0, normalised_radius
-        )
-        normalised_radius = np.where(
-            np.isclose(normalised_radius, -1.0, atol=1e-4), -1.0, normalised_radius
-        )
+        # Floating point error can lead to >|1.0|, and points close to the
+        # outboard/inboard edge are snapped onto it
+        np.clip(normalised_radius, -1.0, 1.0, out=normalised_radius)
+        at_edge = np.isclose(np.abs(normalised_radius), 1.0, atol=1e-4)
+        normalised_radius[at_edge] = np.sign(normalised_radius[at_edge])
 
         thetaR = np.arccos(normalised_radius)
 
-        theta = np.where(R < R_upper, np.pi - theta, theta)
-        theta = np.where((R >= R_upper) & (Z < 0), 2 * np.pi + theta, theta)
-        thetaR = np.where(Z < 0, 2 * np.pi - thetaR, thetaR)
+        # Move theta and thetaR into the correct quadrants in place
+        inboard = R < R_upper
+        below_midplane = Z < 0
+        theta[inboard] = np.pi - theta[inboard]
+        theta[~inboard & below_midplane] += 2 * np.pi
+        thetaR[below_midplane] = 2 * np.pi - thetaR[below_midplane]
 
         # Ensure first point is close to 0 rather than 2pi
-        if theta[0] > np.pi:
-            theta[0] += -2 * np.pi
-            thetaR[0] += -2 * np.pi
+        wrap = -2 * np.pi * (theta[0] > np.pi)
+        theta[0] += wrap
+        thetaR[0] += wrap
 
         self.theta_eq = theta
 
         theta_diff = thetaR - theta
 
-        ntheta = np.outer(self.n, theta)
-
-        cn = simpson(theta_diff * np.cos(ntheta), theta, axis=1) / np.pi
-        sn = simpson(theta_diff * np.sin(ntheta), theta, axis=1) / np.pi
+        cn, sn = self._get_fourier_moments(theta, theta_diff)
 
         self.kappa = kappa
         self.sn = sn
@@ -218,12 +249,24 @@ class LocalGeometryMXH(LocalGeometry):
         self.thetaR = self.get_thetaR(self.theta)
         self.dthetaR_dtheta = self.get_dthetaR_dtheta(self.theta)
 
-        self.R, self.Z = self.get_flux_surface(self.theta)
-
-        s_kappa_init = 0.0
-        params = [shift, s_kappa_init, 0.0, *[0.0] * self.n_moments * 2]
+        self.R, self.Z = self.get_flux_surface(self.theta, thetaR=self.thetaR)
 
-        fits = least_squares(self.minimise_b_poloidal, params)
+        # Neighbouring flux surfaces have similar gradients, so optionally start
+        # from the last fit made by this object
+        if warm_start and self._fit_params is not None:
+            params = self._fit_params
+        else:
+            s_kappa_init = 0.0
+            params = [shift, s_kappa_init, 0.0, *[0.0] * self.n_moments * 2]
+
+        fits = least_squares(
+            self.minimise_b_poloidal,
+            params,
+            jac=self._bpol_jacobian,
+            method="lm",
+            ftol=1e-10,
+            xtol=1e-10,
+        )
 
         # Check that least squares didn't fail
         if not fits.success:
@@ -244,53 +287,252 @@ class LocalGeometryMXH(LocalGeometry):
         self.shift = fits.x[0]
         self.s_kappa = fits.x[1]
         self.dZ0dr = fits.x[2]
-        self.dcndr = fits.x[3 : self.n_moments + 3]
-        self.dsndr = fits.x[self.n_moments + 3 :]
-
         # Force dsndr[0] which has no impact on flux surface
-        self.dsndr[0] = 0.0
+        fits.x[self.n_moments + 3] = 0.0
+
+        self._coeffs[2:] = fits.x[3:].reshape(2, self.n_moments)
+
+        self._fit_params = fits.x.copy()
 
         self.dthetaR_dr = self.get_dthetaR_dr(self.theta, self.dcndr, self.dsndr)
 
+    def _get_fourier_moments(self, theta, theta_diff):
+        r"""
+        Cosine and sine moments of :math:`\theta_R - \theta`. If theta is a uniform
+        grid over one period these are obtained from a single FFT, otherwise they are
+        integrated with Simpson's rule
+
+        Parameters
+        ----------
+        theta : Array
+            theta angles
+        theta_diff : Array
+            :math:`\theta_R - \theta` at each theta
+
+        Returns
+        -------
+        cn : Array
+            cosine moments of thetaR
+        sn : Array
+            sine moments of thetaR
+        """
+
+        dtheta = np.diff(theta)
+        uniform = len(theta) > 2 * self.n_moments and np.allclose(dtheta, dtheta[0])
+
+        if uniform and np.isclose(theta[-1] - theta[0], 2 * np.pi):
+            # Drop repeated endpoint
+            theta = theta[:-1]
+            theta_diff = theta_diff[:-1]
+        elif not (uniform and np.isclose(len(theta) * dtheta[0], 2 * np.pi)):
+            from scipy.integrate import simpson
+
+            cos_ntheta, sin_ntheta = self._get_trig(theta)
+            cn = simpson(theta_diff * cos_ntheta.T, theta, axis=1) / np.pi
+            sn = simpson(theta_diff * sin_ntheta.T, theta, axis=1) / np.pi
+            return cn, sn
+
+        n_theta = len(theta)
+
+        # Shift phase so moments are relative to theta = 0 rather than theta[0]
+        coefficients = (
+            np.fft.rfft(theta_diff)[: self.n_moments]
+            * np.exp(-1j * self._n_vec * theta[0])
+            * (2.0 / n_theta)
+        )
+
+        return coefficients.real, -coefficients.imag
+
+    def _bpol_jacobian(self, params):
+        r"""
+        Analytic Jacobian of ``minimise_b_poloidal`` w.r.t the fitting parameters.
+        Only :math:`\partial R/\partial r` and :math:`\partial Z/\partial r` depend
+        on the parameters, and both are linear in them, so with
+        :math:`J = \partial_r R \partial_\theta Z - \partial_\theta R \partial_r Z`
+        the residual derivative is :math:`(B_\theta / J) \partial J/\partial p`
+
+        Parameters
+        ----------
+        params : Array
+            [shift, s_kappa, dZ0dr, dcndr[n_moments], dsndr[n_moments]]
+
+        Returns
+        -------
+        jacobian : Array
+            Derivative of residual w.r.t params, shape ``(len(theta), len(params))``
+        """
+
+        theta = self.theta
+        dRdtheta, dRdr, dZdtheta, dZdr = self.get_RZ_derivatives(theta, params)
+
+        jacobian_RZ = dRdr * dZdtheta - dRdtheta * dZdr
+        b_poloidal = (
+            np.abs(self.dpsidr)
+            / (self.R * self.a_minor)
+            * np.sqrt(dRdtheta**2 + dZdtheta**2)
+            / jacobian_RZ
+        )
+
+        cos_ntheta, sin_ntheta = self._get_trig(theta)
+        # thetaR does not depend on params, so use the value stored for the fit
+        dJ_dthetaR_dr = -self.rho * np.sin(self.thetaR) * dZdtheta
+
+        dJ_dparams = np.empty((len(theta), len(params)))
+        dJ_dparams[:, 0] = dZdtheta
+        dJ_dparams[:, 1] = -dRdtheta * self.kappa * np.sin(theta)
+        dJ_dparams[:, 2] = -dRdtheta
+        dJ_dparams[:, 3 : self.n_moments + 3] = (
+            dJ_dthetaR_dr[:, np.newaxis] * cos_ntheta
+        )
+        dJ_dparams[:, self.n_moments + 3 :] = dJ_dthetaR_dr[:, np.newaxis] * sin_ntheta
+
+        return (b_poloidal / jacobian_RZ)[:, np.newaxis] * dJ_dparams
+
+    def keys(self):
+        return [*super().keys(), "cn", "sn", "dcndr", "dsndr"]
+
     @property
     def n(self):
-        return np.linspace(0, self.n_moments - 1, self.n_moments)
+        return self._n_vec
 
     @property
-    def n_moments(self):
-        return 4
+    def cn(self):
+        return self._coeffs[0]
+
+    @cn.setter
+    def cn(self, value):
+        self._coeffs[0] = value
+
+    @property
+    def sn(self):
+        return self._coeffs[1]
+
+    @sn.setter
+    def sn(self, value):
+        self._coeffs[1] = value
+
+    @property
+    def dcndr(self):
+        return self._coeffs[2]
+
+    @dcndr.setter
+    def dcndr(self, value):
+        self._coeffs[2] = value
+
+    @property
+    def dsndr(self):
+        return self._coeffs[3]
+
+    @dsndr.setter
+    def dsndr(self, value):
+        self._coeffs[3] = value
 
     @property
     def delta(self):
-        return np.sin(self.sn[1])
+        return math.sin(self._coeffs[1, 1])
 
     @delta.setter
     def delta(self, value):
-        self.sn[1] = np.arcsin(value)
+        self._coeffs[1, 1] = np.arcsin(value)
 
     @property
     def s_delta(self):
-        return self.dsndr[1] * np.sqrt(1 - self.delta**2) * self.rho
+        return self._coeffs[3, 1] * math.sqrt(1 - self.delta**2) * self.rho
 
     @s_delta.setter
     def s_delta(self, value):
-        self.dsndr[1] = value / np.sqrt(1 - self.delta**2) / self.rho
+        self._coeffs[3, 1] = value / math.sqrt(1 - self.delta**2) / self.rho
 
     @property
     def zeta(self):
-        return -self["sn"][2]
+        return -self._coeffs[1, 2]
 
     @zeta.setter
     def zeta(self, value):
-        self["sn"][2] = -value
+        self._coeffs[1, 2] = -value
 
     @property
     def s_zeta(self):
-        return -self.dsndr[2] * self.rho
+        return -self._coeffs[3, 2] * self.rho
 
     @s_zeta.setter
     def s_zeta(self, value):
-        self.dsndr[2] = -value / self.rho
+        self._coeffs[3, 2] = -value / self.rho
+
+    def _get_trig(self, theta):
+        r"""
+        Tables of :math:`\cos(n\theta)` and :math:`\sin(n\theta)` for each moment.
+        Harmonics are built by recurrence from :math:`\cos(\theta)` and
+        :math:`\sin(\theta)`, and the result is cached against the values of the
+        ``theta`` array so that repeated calls with the same grid (e.g. during a fit)
+        reuse it
+
+        Parameters
+        ----------
+        theta : Array
+            theta angles
+
+        Returns
+        -------
+        cos_ntheta : Array
+            :math:`\cos(n\theta)` with shape ``(len(theta), n_moments)``
+        sin_ntheta : Array
+            :math:`\sin(n\theta)` with shape ``(len(theta), n_moments)``
+        """
+
+        cached = self._get_cached_trig(theta)
+        if cached is not None:
+            return cached
+
+        flat_theta = np.ravel(theta)
+        cos_theta = np.cos(flat_theta)
+        sin_theta = np.sin(flat_theta)
+
+        cos_ntheta = np.empty((len(flat_theta), self.n_moments))
+        sin_ntheta = np.empty((len(flat_theta), self.n_moments))
+        cos_ntheta[:, 0] = 1.0
+        sin_ntheta[:, 0] = 0.0
+        if self.n_moments > 1:
+            cos_ntheta[:, 1] = cos_theta
+            sin_ntheta[:, 1] = sin_theta
+
+        # cos(n theta) = 2 cos(theta) cos((n-1) theta) - cos((n-2) theta), same for sin
+        two_cos_theta = 2.0 * cos_theta
+        for n in range(2, self.n_moments):
+            cos_ntheta[:, n] = (
+                two_cos_theta * cos_ntheta[:, n - 1] - cos_ntheta[:, n - 2]
+            )
+            sin_ntheta[:, n] = (
+                two_cos_theta * sin_ntheta[:, n - 1] - sin_ntheta[:, n - 2]
+            )
+
+        # Only a handful of theta grids are in use at any one time
+        if len(self._trig_cache) >= 4:
+            del self._trig_cache[next(iter(self._trig_cache))]
+        self._trig_cache[id(theta)] = (np.copy(theta), cos_ntheta, sin_ntheta)
+
+        return cos_ntheta, sin_ntheta
+
+    def _get_cached_trig(self, theta):
+        r"""
+        Cached :math:`\cos(n\theta)`, :math:`\sin(n\theta)` tables for ``theta``.
+        The cached grid is compared by value, so arrays modified in place since
+        the tables were built are not matched
+
+        Parameters
+        ----------
+        theta : Array
+            theta angles
+
+        Returns
+        -------
+        tables : Tuple or None
+            ``(cos_ntheta, sin_ntheta)`` if cached, otherwise None
+        """
+        cached = self._trig_cache.get(id(theta))
+        if cached is None or not np.array_equal(cached[0], theta):
+            return None
+        return cached[1], cached[2]
 
     def get_thetaR(self, theta):
         """
@@ -305,15 +547,58 @@ class LocalGeometryMXH(LocalGeometry):
             Poloidal angle used in definition of R
         """
 
-        ntheta = np.outer(theta, self.n)
+        # The default 4 moments don't need the full tables
+        if self.n_moments == 4:
+            return self._get_thetaR_n4(theta, self._coeffs[0], self._coeffs[1])
 
-        thetaR = theta + np.sum(
-            (self.cn * np.cos(ntheta) + self.sn * np.sin(ntheta)),
-            axis=1,
-        )
+        cos_ntheta, sin_ntheta = self._get_trig(theta)
+
+        thetaR = theta + cos_ntheta @ self._coeffs[0] + sin_ntheta @ self._coeffs[1]
 
         return thetaR
 
+    @staticmethod
+    def _get_thetaR_n4(theta, cn, sn):
+        r"""
+        :math:`\theta_R` with the sum over 4 moments unrolled, building
+        :math:`\cos(n\theta)`, :math:`\sin(n\theta)` by recurrence without
+        storing them in a table
+
+        Parameters
+        ----------
+        theta : Array
+            theta angles
+        cn : Array
+            cosine moments of thetaR
+        sn : Array
+            sine moments of thetaR
+
+        Returns
+        -------
+        thetaR : Array
+            Poloidal angle used in definition of R
+        """
+        # Flatten to match the shape returned by the table-based helpers
+        theta = np.ravel(theta)
+
+        c1 = np.cos(theta)
+        s1 = np.sin(theta)
+        c2 = 2 * c1 * c1 - 1
+        s2 = 2 * s1 * c1
+        c3 = c1 * c2 - s1 * s2
+        s3 = s1 * c2 + c1 * s2
+
+        return (
+            theta
+            + cn[0]
+            + cn[1] * c1
+            + sn[1] * s1
+            + cn[2] * c2
+            + sn[2] * s2
+            + cn[3] * c3
+            + sn[3] * s3
+        )
+
     def get_dthetaR_dtheta(self, theta):
         """
 
@@ -327,11 +612,12 @@ class LocalGeometryMXH(LocalGeometry):
             theta derivative of poloidal angle used in R
         """
 
-        ntheta = np.outer(theta, self.n)
+        cos_ntheta, sin_ntheta = self._get_trig(theta)
 
-        dthetaR_dtheta = 1.0 + np.sum(
-            (-self.cn * self.n * np.sin(ntheta) + self.sn * self.n * np.cos(ntheta)),
-            axis=1,
+        dthetaR_dtheta = (
+            1.0
+            + cos_ntheta @ (self._n_vec * self._coeffs[1])
+            - sin_ntheta @ (self._n_vec * self._coeffs[0])
         )
 
         return dthetaR_dtheta
@@ -349,11 +635,11 @@ class LocalGeometryMXH(LocalGeometry):
             second theta derivative of poloidal angle used in R
         """
 
-        ntheta = np.outer(theta, self.n)
+        cos_ntheta, sin_ntheta = self._get_trig(theta)
 
-        d2thetaR_dtheta2 = -np.sum(
-            ((self.n**2) * (self.cn * np.cos(ntheta) + self.sn * np.sin(ntheta))),
-            axis=1,
+        d2thetaR_dtheta2 = -(
+            cos_ntheta @ (self._n2_vec * self._coeffs[0])
+            + sin_ntheta @ (self._n2_vec * self._coeffs[1])
         )
 
         return d2thetaR_dtheta2
@@ -374,12 +660,9 @@ class LocalGeometryMXH(LocalGeometry):
         -------
 
         """
-        ntheta = np.outer(theta, self.n)
+        cos_ntheta, sin_ntheta = self._get_trig(theta)
 
-        dthetaR_dr = np.sum(
-            (dcndr * np.cos(ntheta) + dsndr * np.sin(ntheta)),
-            axis=1,
-        )
+        dthetaR_dr = cos_ntheta @ dcndr + sin_ntheta @ dsndr
 
         return dthetaR_dr
 
@@ -399,11 +682,10 @@ class LocalGeometryMXH(LocalGeometry):
         -------
 
         """
-        ntheta = np.outer(theta, self.n)
+        cos_ntheta, sin_ntheta = self._get_trig(theta)
 
-        d2thetaR_drdtheta = np.sum(
-            (-self.n * dcndr * np.sin(ntheta) + self.n * dsndr * np.cos(ntheta)),
-            axis=1,
+        d2thetaR_drdtheta = cos_ntheta @ (self._n_vec * dsndr) - sin_ntheta @ (
+            self._n_vec * dcndr
         )
 
         return d2thetaR_drdtheta
@@ -456,13 +738,21 @@ class LocalGeometryMXH(LocalGeometry):
         dthetaR_dr = self.get_dthetaR_dr(theta, dcndr, dsndr)
         dthetaR_dtheta = self.get_dthetaR_dtheta(theta)
 
+        # Shared between the R derivatives
+        sin_thetaR = np.sin(thetaR)
+        cos_thetaR = np.cos(thetaR)
+
         dZdtheta = self.get_dZdtheta(theta, normalised)
 
         dZdr = self.get_dZdr(theta, dZ0dr, s_kappa)
 
-        dRdtheta = self.get_dRdtheta(thetaR, dthetaR_dtheta, normalised)
+        dRdtheta = self.get_dRdtheta(
+            thetaR, dthetaR_dtheta, normalised, sin_thetaR=sin_thetaR
+        )
 
-        dRdr = self.get_dRdr(shift, thetaR, dthetaR_dr)
+        dRdr = self.get_dRdr(
+            shift, thetaR, dthetaR_dr, sin_thetaR=sin_thetaR, cos_thetaR=cos_thetaR
+        )
 
         return dRdtheta, dRdr, dZdtheta, dZdr
 
@@ -499,13 +789,26 @@ class LocalGeometryMXH(LocalGeometry):
         d2thetaR_drdtheta = self.get_d2thetaR_drdtheta(theta, self.dcndr, self.dsndr)
         d2thetaR_dtheta2 = self.get_d2thetaR_dtheta2(theta)
 
+        sin_thetaR = np.sin(thetaR)
+        cos_thetaR = np.cos(thetaR)
+
         d2Zdtheta2 = self.get_d2Zdtheta2(theta, normalised)
         d2Zdrdtheta = self.get_d2Zdrdtheta(theta, self.s_kappa)
         d2Rdtheta2 = self.get_d2Rdtheta2(
-            thetaR, dthetaR_dtheta, d2thetaR_dtheta2, normalised
+            thetaR,
+            dthetaR_dtheta,
+            d2thetaR_dtheta2,
+            normalised,
+            sin_thetaR=sin_thetaR,
+            cos_thetaR=cos_thetaR,
         )
         d2Rdrdtheta = self.get_d2Rdrdtheta(
-            thetaR, dthetaR_dr, dthetaR_dtheta, d2thetaR_drdtheta
+            thetaR,
+            dthetaR_dr,
+            dthetaR_dtheta,
+            d2thetaR_drdtheta,
+            sin_thetaR=sin_thetaR,
+            cos_thetaR=cos_thetaR,
         )
 
         return d2Rdtheta2, d2Rdrdtheta, d2Zdtheta2, d2Zdrdtheta
@@ -592,8 +895,8 @@ class LocalGeometryMXH(LocalGeometry):
         """
         return self.kappa * np.cos(theta) * (1 + s_kappa)
 
-    def get_dRdtheta(self, thetaR, dthetaR_dtheta, normalised=False):
-        """
+    def get_dRdtheta(self, thetaR, dthetaR_dtheta, normalised=False, sin_thetaR=None):
+        r"""
         Calculates the derivatives of :math:`R(r, \theta)` w.r.t :math:`\theta`
 
         Parameters
@@ -602,6 +905,8 @@ class LocalGeometryMXH(LocalGeometry):
             Array of thetaR points to evaluate dRdtheta on
         dthetaR_dtheta : ArrayLike
             Theta derivative of thetaR
+        sin_thetaR : ArrayLike [Optional]
+            :math:`\sin(\theta_R)`, if already known
         -------
         dRdtheta : Array
             Derivative of :math:`R` w.r.t :math:`\theta`
@@ -612,12 +917,21 @@ class LocalGeometryMXH(LocalGeometry):
         else:
             rmin = self.r_minor
 
-        return -rmin * np.sin(thetaR) * dthetaR_dtheta
+        if sin_thetaR is None:
+            sin_thetaR = np.sin(thetaR)
+
+        return -rmin * sin_thetaR * dthetaR_dtheta
 
     def get_d2Rdtheta2(
-        self, thetaR, dthetaR_dtheta, d2thetaR_dtheta2, normalised=False
+        self,
+        thetaR,
+        dthetaR_dtheta,
+        d2thetaR_dtheta2,
+        normalised=False,
+        sin_thetaR=None,
+        cos_thetaR=None,
     ):
-        """
+        r"""
         Calculates the second derivative of :math:`R(r, \theta)` w.r.t :math:`\theta`
 
         Parameters
@@ -628,6 +942,10 @@ class LocalGeometryMXH(LocalGeometry):
             Theta derivative of thetaR
         d2thetaR_dtheta2 : ArrayLike
             Second theta derivative of thetaR
+        sin_thetaR : ArrayLike [Optional]
+            :math:`\sin(\theta_R)`, if already known
+        cos_thetaR : ArrayLike [Optional]
+            :math:`\cos(\theta_R)`, if already known
         -------
         d2Rdtheta2 : Array
             Second derivative of :math:`R` w.r.t :math:`\theta`
@@ -638,11 +956,30 @@ class LocalGeometryMXH(LocalGeometry):
         else:
             rmin = self.r_minor
 
-        return -rmin * np.sin(thetaR) * d2thetaR_dtheta2 - rmin * (
-            dthetaR_dtheta**2
-        ) * np.cos(thetaR)
+        if sin_thetaR is None:
+            sin_thetaR = np.sin(thetaR)
+        if cos_thetaR is None:
+            cos_thetaR = np.cos(thetaR)
+
+        if numexpr is not None and np.size(thetaR) >= _NUMEXPR_MIN_SIZE:
+            return numexpr.evaluate(
+                "-rmin * sin_thetaR * d2thetaR_dtheta2"
+                " - rmin * dthetaR_dtheta**2 * cos_thetaR",
+                local_dict={
+                    "rmin": rmin,
+                    "sin_thetaR": sin_thetaR,
+                    "cos_thetaR": cos_thetaR,
+                    "dthetaR_dtheta": dthetaR_dtheta,
+                    "d2thetaR_dtheta2": d2thetaR_dtheta2,
+                },
+            )
+
+        return (
+            -rmin * sin_thetaR * d2thetaR_dtheta2
+            - rmin * (dthetaR_dtheta**2) * cos_thetaR
+        )
 
-    def get_dRdr(self, shift, thetaR, dthetaR_dr):
+    def get_dRdr(self, shift, thetaR, dthetaR_dr, sin_thetaR=None, cos_thetaR=None):
         r"""
         Calculates the derivatives of :math:`R(r, \theta)` w.r.t :math:`r`
 
@@ -656,16 +993,45 @@ class LocalGeometryMXH(LocalGeometry):
             Array of thetaR points to evaluate dRdtheta on
         dthetaR_dr : ArrayLike
             Radial derivative of thetaR
+        sin_thetaR : ArrayLike [Optional]
+            :math:`\sin(\theta_R)`, if already known
+        cos_thetaR : ArrayLike [Optional]
+            :math:`\cos(\theta_R)`, if already known
 
         Returns
         -------
         dRdr : Array
             Derivative of :math:`R` w.r.t :math:`r`
         """
-        return shift + np.cos(thetaR) - self.rho * np.sin(thetaR) * dthetaR_dr
+        if sin_thetaR is None:
+            sin_thetaR = np.sin(thetaR)
+        if cos_thetaR is None:
+            cos_thetaR = np.cos(thetaR)
+
+        if numexpr is not None and np.size(thetaR) >= _NUMEXPR_MIN_SIZE:
+            return numexpr.evaluate(
+                "shift + cos_thetaR - rho * sin_thetaR * dthetaR_dr",
+                local_dict={
+                    "shift": shift,
+                    "rho": self.rho,
+                    "sin_thetaR": sin_thetaR,
+                    "cos_thetaR": cos_thetaR,
+                    "dthetaR_dr": dthetaR_dr,
+                },
+            )
 
-    def get_d2Rdrdtheta(self, thetaR, dthetaR_dr, dthetaR_dtheta, d2thetaR_drdtheta):
-        """
+        return shift + cos_thetaR - self.rho * sin_thetaR * dthetaR_dr
+
+    def get_d2Rdrdtheta(
+        self,
+        thetaR,
+        dthetaR_dr,
+        dthetaR_dtheta,
+        d2thetaR_drdtheta,
+        sin_thetaR=None,
+        cos_thetaR=None,
+    ):
+        r"""
         Calculate the second derivative of :math:`R(r, \theta)` w.r.t :math:`r` and :math:`\theta`
 
         Parameters
@@ -680,21 +1046,45 @@ class LocalGeometryMXH(LocalGeometry):
             Theta derivative of thetaR
         d2thetaR_drdtheta : ArrayLike
             Second derivative of thetaR w.r.t :math:`r` and :math:`\theta`
+        sin_thetaR : ArrayLike [Optional]
+            :math:`\sin(\theta_R)`, if already known
+        cos_thetaR : ArrayLike [Optional]
+            :math:`\cos(\theta_R)`, if already known
 
         Returns
         -------
         d2Rdrdtheta : Array
             Second derivative of R w.r.t :math:`r` and :math:`\theta`
         """
-        return -dthetaR_dtheta * np.sin(thetaR) - self.rho * (
-            np.sin(thetaR) * d2thetaR_drdtheta
-            + dthetaR_dr * dthetaR_dtheta * np.cos(thetaR)
+        if sin_thetaR is None:
+            sin_thetaR = np.sin(thetaR)
+        if cos_thetaR is None:
+            cos_thetaR = np.cos(thetaR)
+
+        if numexpr is not None and np.size(thetaR) >= _NUMEXPR_MIN_SIZE:
+            return numexpr.evaluate(
+                "-dthetaR_dtheta * sin_thetaR - rho * ("
+                "sin_thetaR * d2thetaR_drdtheta"
+                " + dthetaR_dr * dthetaR_dtheta * cos_thetaR)",
+                local_dict={
+                    "rho": self.rho,
+                    "sin_thetaR": sin_thetaR,
+                    "cos_thetaR": cos_thetaR,
+                    "dthetaR_dr": dthetaR_dr,
+                    "dthetaR_dtheta": dthetaR_dtheta,
+                    "d2thetaR_drdtheta": d2thetaR_drdtheta,
+                },
+            )
+
+        return -dthetaR_dtheta * sin_thetaR - self.rho * (
+            sin_thetaR * d2thetaR_drdtheta + dthetaR_dr * dthetaR_dtheta * cos_thetaR
         )
 
     def get_flux_surface(
         self,
         theta: ArrayLike,
         normalised=True,
+        thetaR: Optional[ArrayLike] = None,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Generates (R,Z) of a flux surface given a set of MXH fits
@@ -705,6 +1095,8 @@ class LocalGeometryMXH(LocalGeometry):
             Values of theta to evaluate flux surface
         normalised : Boolean
             Control whether or not to return normalised flux surface
+        thetaR : Array [Optional]
+            thetaR at theta, if already known. Otherwise calculated from theta
 
         Returns
         -------
@@ -714,10 +1106,17 @@ class LocalGeometryMXH(LocalGeometry):
             Z Values for this flux surface (if not normalised then in [m])
         """
 
-        thetaR = self.get_thetaR(theta)
+        if thetaR is None:
+            thetaR = self.get_thetaR(theta)
+
+        # Build R and Z in place on the freshly allocated cos/sin arrays
+        R = np.cos(thetaR)
+        R *= self.rho
+        R += self.Rmaj
 
-        R = self.Rmaj + self.rho * np.cos(thetaR)
-        Z = self.Z0 + self.kappa * self.rho * np.sin(theta)
+        Z = np.sin(theta)
+        Z *= self.kappa * self.rho
+        Z += self.Z0
 
         if not normalised:
             R *= self.a_minor
@@ -0,0 +1,55 @@
+import warnings
+
+import matplotlib
+import pytest
+
+# Use a non-interactive backend so that plotting tests don't need a display, and
+# parallel test workers don't contend for a GUI backend
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from pyrokinetics import Pyro, template_dir  # noqa: E402
+from pyrokinetics.equilibrium import (  # noqa: E402
+    EquilibriumCOCOSWarning,
+    read_equilibrium,
+)
+
+# Equilibria read from the template files are shared by the whole session, so tests
+# using them must not modify them.
+
+
+@pytest.fixture(scope="session")
+def geqdsk_equilibrium():
+    warnings.simplefilter("ignore", category=EquilibriumCOCOSWarning)
+    eq = read_equilibrium(template_dir / "test.geqdsk")
+    warnings.simplefilter("default", category=EquilibriumCOCOSWarning)
+    return eq
+
+
+@pytest.fixture(scope="session")
+def transp_cdf_equilibrium():
+    warnings.simplefilter("ignore", EquilibriumCOCOSWarning)
+    eq = read_equilibrium(template_dir / "transp_eq.cdf", time=0.2)
+    warnings.simplefilter("default", EquilibriumCOCOSWarning)
+    return eq
+
+
+@pytest.fixture(scope="session")
+def transp_gq_equilibrium():
+    warnings.simplefilter("ignore", EquilibriumCOCOSWarning)
+    eq = read_equilibrium(template_dir / "transp_eq.geqdsk")
+    warnings.simplefilter("default", EquilibriumCOCOSWarning)
+    return eq
+
+
+@pytest.fixture(scope="session")
+def cgyro_pyro():
+    """Pyro built from the CGYRO template. Copy any part of it a test modifies"""
+    return Pyro(gk_file=template_dir / "input.cgyro", gk_code="CGYRO")
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close any pyplot figures a test leaves open"""
+    yield
+    plt.close("all")
@@ -1,10 +1,11 @@
+import math
 import warnings
 from itertools import product
 from typing import Any, Dict
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+import xarray as xr
 from numpy.testing import assert_allclose, assert_array_equal
 from pyloidal.cocos import cocos_transform
 from pyrokinetics import template_dir
@@ -58,9 +59,10 @@ def expected() -> Dict[str, Any]:
     Z = np.linspace(-2.0, 2.0, n_Z)
     R_axis = 0.5 * (R_max + R_min)
     Z_axis = 0.5 * (Z_max + Z_min)
-    radial_grid = np.sqrt((R - R_axis)[:, np.newaxis] ** 2 + (Z - Z_axis) ** 2)
     psi_offset = -5.1
-    psi_RZ = 2 * np.pi * (radial_grid) + psi_offset
+    psi_RZ = np.hypot.outer(R - R_axis, Z - Z_axis)
+    psi_RZ *= 2 * np.pi
+    psi_RZ += psi_offset
     psi_axis = np.min(psi_RZ)
     psi_lcfs = np.min(psi_RZ[0])
     a_minor = 0.5 * (R_max - R_min)
@@ -198,6 +200,12 @@ def circular_eq(expected) -> Equilibrium:
     return eq
 
 
+@pytest.fixture(scope="module")
+def flux_surface_half(circular_eq):
+    """Flux surface of ``circular_eq`` at ``psi_n=0.5``, shared by read-only tests"""
+    return circular_eq.flux_surface(0.5)
+
+
 _units = [units.m, units.cm]
 _cocos = list(range(1, 9)) + list(range(11, 19))
 _params = [{"len_units": u, "cocos": c} for u, c in product(_units, _cocos)]
@@ -344,6 +352,16 @@ def test_parametrized_eq_data_vars(parametrized_eq, expected):
     assert_allclose(data_vars["Z_mid"].data.magnitude, expected["Z_mid"].magnitude)
 
 
+def _close(a, b, rel_tol=1e-5, abs_tol=1e-8) -> bool:
+    """
+    Scalar equivalent of ``np.isclose``, avoiding array dispatch through pint.
+    Quantities are compared in the units of ``b``.
+    """
+    if hasattr(b, "units"):
+        a, b = a.to(b.units).magnitude, b.magnitude
+    return math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
+
+
 def test_parametrized_eq_attrs(parametrized_eq, expected):
     eq = parametrized_eq
     # Check units
@@ -357,15 +375,15 @@ def test_parametrized_eq_attrs(parametrized_eq, expected):
     assert eq.B_0.units == expected["B_units"]
     assert eq.I_p.units == expected["I_units"]
     # Check values
-    assert np.isclose(eq.R_axis, expected["R_axis"])
-    assert np.isclose(eq.Z_axis, expected["Z_axis"])
-    assert np.isclose(eq.psi_axis, expected["psi_axis"])
-    assert np.isclose(eq.psi_lcfs, expected["psi_lcfs"])
-    assert np.isclose(eq.a_minor, expected["a_minor"])
-    assert np.isclose(eq.dR, expected["dR"])
-    assert np.isclose(eq.dZ, expected["dZ"])
-    assert np.isclose(eq.B_0, expected["B_0"])
-    assert np.isclose(eq.I_p, expected["I_p"])
+    assert _close(eq.R_axis, expected["R_axis"])
+    assert _close(eq.Z_axis, expected["Z_axis"])
+    assert _close(eq.psi_axis, expected["psi_axis"])
+    assert _close(eq.psi_lcfs, expected["psi_lcfs"])
+    assert _close(eq.a_minor, expected["a_minor"])
+    assert _close(eq.dR, expected["dR"])
+    assert _close(eq.dZ, expected["dZ"])
+    assert _close(eq.B_0, expected["B_0"])
+    assert _close(eq.I_p, expected["I_p"])
     assert eq.eq_type == "None"
 
 
@@ -393,21 +411,22 @@ def test_circular_eq_func(circular_eq, expected, func):
     eq = circular_eq
     eq_func = getattr(eq, func)
     expected_vals = expected[f"{func}_vals"]
-    assert eq_func(0).units == expected_vals.units
-    for psi_n, expect in zip(expected["psi_n_vals"], expected_vals):
-        assert np.isclose(eq_func(psi_n), expect)
+    # Evaluate all psi_n in one call. Some quantities only have expected values for
+    # the first few psi_n
+    actual = eq_func(expected["psi_n_vals"][: len(expected_vals)])
+    assert actual.units == expected_vals.units
+    assert np.allclose(actual.magnitude, expected_vals.magnitude)
 
 
 def test_circular_eq_psi_n(circular_eq, expected):
-    eq = circular_eq
-    assert eq.psi_n(0).units == expected["psi_n_vals"].units
-    for psi, expect in zip(expected["psi_vals"], expected["psi_n_vals"]):
-        assert np.isclose(eq.psi_n(psi), expect)
+    actual = circular_eq.psi_n(expected["psi_vals"])
+    assert actual.units == expected["psi_n_vals"].units
+    assert np.allclose(actual.magnitude, expected["psi_n_vals"].magnitude)
 
 
-@pytest.mark.parametrize(
-    "key",
-    [
+def test_equilibrium_bad_units(expected):
+    """Test to ensure Equilibrium raises an exception when given incorrect units"""
+    keys = [
         "R",
         "Z",
         "psi_RZ",
@@ -424,39 +443,16 @@ def test_circular_eq_psi_n(circular_eq, expected):
         "a_minor",
         "B_0",
         "I_p",
-    ],
-)
-def test_equilibrium_bad_units(expected, key):
-    """Test to ensure Equilibrium raises an exception when given incorrect units"""
-    new_args = {}
-    for k in expected:
-        if key == k:
-            new_args[k] = expected[k] * units.s
-        else:
-            new_args[k] = expected[k]
-    with pytest.raises(Exception):
-        Equilibrium(
-            R=new_args["R"],
-            Z=new_args["Z"],
-            psi_RZ=new_args["psi_RZ"],
-            psi=new_args["psi"],
-            F=new_args["F"],
-            FF_prime=new_args["FF_prime"],
-            p=new_args["p"],
-            p_prime=new_args["p_prime"],
-            q=new_args["q"],
-            R_major=new_args["R_major"],
-            r_minor=new_args["r_minor"],
-            Z_mid=new_args["Z_mid"],
-            psi_lcfs=new_args["psi_lcfs"],
-            a_minor=new_args["a_minor"],
-            B_0=new_args["B_0"],
-            I_p=new_args["I_p"],
-        )
+    ]
+    args = {k: expected[k] for k in keys}
+    for key in keys:
+        bad_args = {**args, key: args[key] * units.s}
+        with pytest.raises(Exception):
+            Equilibrium(**bad_args)
 
 
-def test_circular_eq_flux_surface(circular_eq, expected):
-    fs = circular_eq.flux_surface(0.5)
+def test_circular_eq_flux_surface(flux_surface_half, expected):
+    fs = flux_surface_half
     radius = np.hypot(fs["R"] - fs.R_major, fs["Z"] - fs.Z_mid).data.magnitude
     R_max = expected["R"][-1].magnitude
     R_min = expected["R"][0].magnitude
@@ -492,11 +488,11 @@ def test_circular_eq_plot(circular_eq, quantity, normalised):
     assert psi.long_name in ax.get_xlabel()
     assert eq[quantity].long_name in ax.get_ylabel()
     # Ensure the correct data is plotted
+    x_data = psi.data.magnitude
+    y_data = eq[quantity].data.magnitude
     for line in ax.lines:
-        assert_allclose(line.get_xdata(), psi.data.magnitude)
-        assert_allclose(line.get_ydata(), eq[quantity].data.magnitude)
-    # Remove figure so it doesn't sit around in memory
-    plt.close(ax.get_figure())
+        assert_allclose(line.get_xdata(), x_data)
+        assert_allclose(line.get_ydata(), y_data)
 
 
 def test_circular_eq_plot_bad_quantity(circular_eq):
@@ -518,8 +514,6 @@ def test_circular_eq_plot_contour(circular_eq):
     # Test correct labels
     assert eq["R"].long_name in ax.get_xlabel()
     assert eq["Z"].long_name in ax.get_ylabel()
-    # Remove figure so it doesn't sit around in memory
-    plt.close(ax.get_figure())
 
 
 @pytest.mark.parametrize(
@@ -530,8 +524,8 @@ def test_circular_eq_plot_contour(circular_eq):
         "B_poloidal",
     ],
 )
-def test_circular_eq_flux_surface_plot(circular_eq, quantity):
-    fs = circular_eq.flux_surface(0.5)
+def test_circular_eq_flux_surface_plot(flux_surface_half, quantity):
+    fs = flux_surface_half
     # Test plot with no provided axes, provide kwargs
     ax = fs.plot(quantity, label="plot 1")
     # Plot again on same ax with new label
@@ -540,21 +534,20 @@ def test_circular_eq_flux_surface_plot(circular_eq, quantity):
     assert fs["theta"].long_name in ax.get_xlabel()
     assert fs[quantity].long_name in ax.get_ylabel()
     # Ensure the correct data is plotted
+    x_data = fs["theta"].data.magnitude
+    y_data = fs[quantity].data.magnitude
     for line in ax.lines:
-        assert_allclose(line.get_xdata(), fs["theta"].data.magnitude)
-        assert_allclose(line.get_ydata(), fs[quantity].data.magnitude)
-    # Remove figure so it doesn't sit around in memory
-    plt.close(ax.get_figure())
+        assert_allclose(line.get_xdata(), x_data)
+        assert_allclose(line.get_ydata(), y_data)
 
 
-def test_circular_eq_flux_surface_plot_bad_quantity(circular_eq):
-    fs = circular_eq.flux_surface(0.7)
+def test_circular_eq_flux_surface_plot_bad_quantity(flux_surface_half):
     with pytest.raises(ValueError):
-        fs.plot("hello world")
+        flux_surface_half.plot("hello world")
 
 
-def test_circular_eq_flux_surface_plot_path(circular_eq):
-    fs = circular_eq.flux_surface(0.5)
+def test_circular_eq_flux_surface_plot_path(flux_surface_half):
+    fs = flux_surface_half
     # Test plot with no provided axes, provide kwargs
     ax = fs.plot_path(label="plot 1")
     # Plot again on same ax with new label
@@ -563,9 +556,11 @@ def test_circular_eq_flux_surface_plot_path(circular_eq):
     assert fs["R"].long_name in ax.get_xlabel()
     assert fs["Z"].long_name in ax.get_ylabel()
     # Ensure the correct data is plotted
+    x_data = fs["R"].data.magnitude
+    y_data = fs["Z"].data.magnitude
     for line in ax.lines:
-        assert_allclose(line.get_xdata(), fs["R"].data.magnitude)
-        assert_allclose(line.get_ydata(), fs["Z"].data.magnitude)
+        assert_allclose(line.get_xdata(), x_data)
+        assert_allclose(line.get_ydata(), y_data)
 
 
 def test_circular_eq_netcdf_round_trip(tmp_path, circular_eq):
@@ -575,20 +570,18 @@ def test_circular_eq_netcdf_round_trip(tmp_path, circular_eq):
     file_ = dir_ / "my_netcdf.nc"
     eq.to_netcdf(file_)
     eq2 = read_equilibrium(file_)
-    # Test coords
-    for k, v in eq.coords.items():
-        assert k in eq2.coords
-        assert_allclose(v.data.magnitude, eq2[k].data.magnitude)
-        assert v.data.units == eq2[k].data.units
-    # Test data vars
-    for k, v in eq.data_vars.items():
-        assert k in eq2.data_vars
-        assert_allclose(v.data.magnitude, eq2[k].data.magnitude)
-        assert v.data.units == eq2[k].data.units
+    # Test coords and data vars, comparing units and magnitudes separately
+    ds, ds2 = eq.data, eq2.data
+    assert {k: v.data.units for k, v in ds.variables.items()} == {
+        k: v.data.units for k, v in ds2.variables.items()
+    }
+    xr.testing.assert_allclose(
+        ds.pint.dequantify(), ds2.pint.dequantify(), rtol=1e-7, atol=0
+    )
     # Test attributes
     for k, v in eq.attrs.items():
         if hasattr(v, "magnitude"):
-            assert np.isclose(v, eq2.attrs[k])
+            assert _close(eq2.attrs[k], v)
             assert getattr(eq, k).units == getattr(eq2, k).units
         else:
             assert v == eq2.attrs[k]
@@ -632,7 +625,7 @@ def test_reverse_ipbt():
 
     for key, value in expected_attrs.items():
         actual = getattr(eq, key)
-        assert np.isclose(actual.m, value)
+        assert _close(actual.m, value)
 
     expected_on_axis = {
         "F": 5.14534676,
@@ -649,4 +642,4 @@ def test_reverse_ipbt():
 
     for key, value in expected_on_axis.items():
         actual = getattr(eq, key)(0.0)
-        assert np.isclose(actual.m, value)
+        assert _close(actual.m, value)
@@ -17,14 +17,6 @@ def example_file(request):
     return template_dir / request.param
 
 
-@pytest.fixture(scope="module")
-def geqdsk_equilibrium():
-    warnings.simplefilter("ignore", category=EquilibriumCOCOSWarning)
-    eq = read_equilibrium(template_dir / "test.geqdsk")
-    warnings.simplefilter("default", category=EquilibriumCOCOSWarning)
-    return eq
-
-
 def test_read(example_file):
     """
     Ensure it can read the example GEQDSK file, and that it produces an Equilibrium
@@ -4,11 +4,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 from pyrokinetics import template_dir
-from pyrokinetics.equilibrium import (
-    Equilibrium,
-    EquilibriumCOCOSWarning,
-    read_equilibrium,
-)
+from pyrokinetics.equilibrium import Equilibrium, EquilibriumCOCOSWarning
 from pyrokinetics.equilibrium.transp import EquilibriumReaderTRANSP
 
 
@@ -83,19 +79,13 @@ def test_verify_file_is_not_transp(filename):
 
 
 @pytest.fixture(scope="module")
-def fs_cdf():
-    warnings.simplefilter("ignore", EquilibriumCOCOSWarning)
-    fs = read_equilibrium(template_dir / "transp_eq.cdf", time=0.2).flux_surface(0.5)
-    warnings.simplefilter("default", EquilibriumCOCOSWarning)
-    return fs
+def fs_cdf(transp_cdf_equilibrium):
+    return transp_cdf_equilibrium.flux_surface(0.5)
 
 
 @pytest.fixture(scope="module")
-def fs_geqdsk():
-    warnings.simplefilter("ignore", EquilibriumCOCOSWarning)
-    fs = read_equilibrium(template_dir / "transp_eq.geqdsk").flux_surface(0.5)
-    warnings.simplefilter("default", EquilibriumCOCOSWarning)
-    return fs
+def fs_geqdsk(transp_gq_equilibrium):
+    return transp_gq_equilibrium.flux_surface(0.5)
 
 
 @pytest.mark.parametrize(
@@ -1,7 +1,7 @@
 import pytest
-from pyrokinetics import Pyro, template_dir
 from pyrokinetics.local_geometry import MetricTerms
 import numpy as np
+from copy import deepcopy
 from itertools import product
 
 import sys
@@ -24,35 +24,13 @@ dZ/dr = sin(theta)
 """
 
 
-def circle_dBzetadr_over_dpsidr(dqdr, q, D, mu0dPdr, r, R0, dpsidr):
+def _circle_analytics(
+    dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta, cos_theta, sin_theta, A
+):
     r"""
-    Equation 3.139, dividing both sides by dpsi/dr
-    Parameters
-    ----------
-    dqdr - derivative of q w.r.t r
-    q - safety factor q
-    D -  sqrt(X**2 - 1)
-    mu0dPdr - Pressure gradient
-    r - Normalised minor radius \rho
-    R0 - Normalised major radius R_{maj}
-    dpsidr - Derivative of \psi w.r.t \rho
-
-    Returns
-    -------
-    dB_zeta / dr / (dpsi/dr)
-    """
-
-    return (
-        dqdr * D / (1 + (q * D) ** 2)
-        - (mu0dPdr * (r ** 2) * R0 / (dpsidr ** 2))
-        * (q * (D ** 2) / (r * (1 + (q * D) ** 2)))
-        - (2 * q / (r * D)) * (1 + (D ** 2)) / (1 + (q * D) ** 2)
-    )
-
+    Analytic results for a circular flux surface, sharing common subexpressions
+    between them
 
-def circle_d2alphadrdtheta(dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta):
-    r"""
-    Equation D.93
     Parameters
     ----------
     dqdr - derivative of q w.r.t r
@@ -64,112 +42,110 @@ def circle_d2alphadrdtheta(dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta):
     dpsidr - Derivative of \psi w.r.t \rho
     X - R0 / r (local aspect ratio)
     theta - poloidal angle
+    cos_theta, sin_theta - cosine and sine of theta
+    A - 2 * arctan(sqrt((X - 1) / (X + 1)) * tan(theta / 2))
 
     Returns
     -------
-    \partial^2 \alpha / \partial \rho \partial \theta
+    dB_zeta / dr / (dpsi/dr) - Equation 3.139, dividing both sides by dpsi/dr
+    \partial^2 \alpha / \partial \rho \partial \theta - Equation D.93
+    \partial \alpha / \partial \rho - Equation D.94
     """
-    return (
-        dqdr * D / (X + np.cos(theta))
-        + (mu0dPdr * (r ** 2) * R0 / (dpsidr ** 2))
-        * (q * D / (r * X))
-        * (X + np.cos(theta) - X * D / (X + np.cos(theta)))
-        - (2 * q * D / r)
-        * (
-            np.cos(theta) / ((X + np.cos(theta)) ** 2)
-            + (1 / D ** 2) / (X + np.cos(theta))
-        )
+    qD = q * D
+    one_plus_qD2 = 1.0 + qD * qD
+    D2 = D * D
+    pressure_coeff = mu0dPdr * r * r * R0 / (dpsidr * dpsidr)
+    X_plus_cos = X + cos_theta
+
+    dBzetadr_over_dpsidr = (
+        dqdr * D / one_plus_qD2
+        - pressure_coeff * (q * D2 / (r * one_plus_qD2))
+        - (2 * q / (r * D)) * (1 + D2) / one_plus_qD2
     )
 
+    d2alphadrdtheta = (
+        dqdr * D / X_plus_cos
+        + pressure_coeff * (qD / (r * X)) * (X_plus_cos - X * D / X_plus_cos)
+        - (2 * qD / r) * (cos_theta / X_plus_cos**2 + (1 / D2) / X_plus_cos)
+    )
 
-def circle_dalphadr(dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta):
-    r"""
-    Equation D.94
-
-    Parameters
-    ----------
-    dqdr - derivative of q w.r.t r
-    q - safety factor q
-    D -  sqrt(X**2 - 1)
-    mu0dPdr - Pressure gradient
-    r - Normalised minor radius \rho
-    R0 - Normalised major radius R_{maj}
-    dpsidr - Derivative of \psi w.r.t \rho
-    X - R0 / r (local aspect ratio)
-    theta - poloidal angle
-
-    Returns
-    -------
-    \partial \alpha / \partial \rho
-    """
-    A = 2 * np.arctan(np.sqrt((X - 1) / (X + 1)) * np.tan(theta / 2))
-    return (
+    dalphadr = (
         dqdr * A
-        + (mu0dPdr * (r ** 2) * R0 / (dpsidr ** 2))
-        * (q * D / (r * X))
-        * (X * theta + np.sin(theta) - X * A)
-        - (2 * q / r) * (X / D) * np.sin(theta) / (X + np.cos(theta))
+        + pressure_coeff * (qD / (r * X)) * (X * theta + sin_theta - X * A)
+        - (2 * q / r) * (X / D) * sin_theta / X_plus_cos
     )
 
+    return dBzetadr_over_dpsidr, d2alphadrdtheta, dalphadr
+
 
 # Test input and outputs of metric terms
-def test_metric_terms_input():
-    pyro = Pyro(gk_file=template_dir / "input.cgyro", gk_code="CGYRO")
-    local_geometry = pyro.local_geometry
-    local_species = pyro.local_species
+def test_metric_terms_input(cgyro_pyro):
+    local_geometry = cgyro_pyro.local_geometry
+    local_species = cgyro_pyro.local_species
     with pytest.raises(TypeError):
         MetricTerms(local_species)
     metric_terms = MetricTerms(local_geometry)
     assert isinstance(metric_terms, MetricTerms)
 
 
-# Scan geometry parameters
-@pytest.mark.parametrize(
-    "q,betaprime,shat",
-    [
-        *product([1.0, 40.0], [1e-4, 0.1], [0.5, 2.0]),
-    ],
-)
-# Check MetricTerms agrees with analytic results for parameters
-def test_alpha_derivatives_for_circle(q, betaprime, shat):
-    pyro = Pyro(gk_file=template_dir / "input.cgyro", gk_code="CGYRO")
-    local_geometry = pyro.local_geometry
-    local_geometry.q = q
-    local_geometry.beta_prime = betaprime
-    local_geometry.shat = shat
-
-    metric_terms = MetricTerms(local_geometry)
+# Check MetricTerms agrees with analytic results while scanning geometry parameters
+def test_alpha_derivatives_for_circle(cgyro_pyro):
+    local_geometry = deepcopy(cgyro_pyro.local_geometry)
 
-    # load equilibrium parameters
+    # geometry quantities, unchanged by the scan
     R0 = local_geometry.Rmaj
     r = local_geometry.rho
-    theta = metric_terms.regulartheta
-    mu0dPdr = metric_terms.mu0dPdr
-    dqdr = metric_terms.dqdr
-    dpsidr = metric_terms.dpsidr
+    X = R0 / r
+    D = np.sqrt(X**2 - 1)
+
+    # theta grid and its trig functions, unchanged by the scan
+    theta = np.linspace(-np.pi, np.pi, 1024)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    A = 2 * np.arctan(np.sqrt((X - 1) / (X + 1)) * np.tan(theta / 2))
 
-    assert np.isclose(metric_terms.q, q)
-    assert np.isclose(metric_terms.mu0dPdr, betaprime / 2.0)
-    assert np.isclose(metric_terms.dqdr, shat * q / r)
+    analytic = {"dB_zeta_dr": [], "d2alpha_drdtheta": [], "dalpha_dr": []}
+    data = {"dB_zeta_dr": [], "d2alpha_drdtheta": [], "dalpha_dr": []}
 
-    # geometry quantities
-    X = R0 / r
-    D = np.sqrt(X ** 2 - 1)
-
-    # test f = (1/dpsidr) * dB_zeta/dr
-    analytic_f = circle_dBzetadr_over_dpsidr(dqdr, q, D, mu0dPdr, r, R0, dpsidr)
-    data_f = metric_terms.dB_zeta_dr / metric_terms.dpsidr
-    assert np.all(np.isclose(analytic_f, data_f, atol=1e-4))
-
-    # test f = d^2 alpha / dr dtheta
-    analytic_f = circle_d2alphadrdtheta(dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta)
-    data_f = metric_terms.d2alpha_drdtheta
-    assert np.all(np.isclose(analytic_f, data_f, atol=1e-4))
-
-    # test f = dalpha / dr
-    analytic_f = circle_dalphadr(dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta)
-    data_f = metric_terms.dalpha_dr
-    assert np.all(np.isclose(analytic_f, data_f, atol=1e-4))
+    for q, betaprime, shat in product([1.0, 40.0], [1e-4, 0.1], [0.5, 2.0]):
+        local_geometry.q = q
+        local_geometry.beta_prime = betaprime
+        local_geometry.shat = shat
+
+        metric_terms = MetricTerms(local_geometry, theta=theta)
+
+        # load equilibrium parameters
+        mu0dPdr = metric_terms.mu0dPdr
+        dqdr = metric_terms.dqdr
+        dpsidr = metric_terms.dpsidr
+
+        assert np.isclose(metric_terms.q, q)
+        assert np.isclose(mu0dPdr, betaprime / 2.0)
+        assert np.isclose(dqdr, shat * q / r)
+
+        (
+            analytic_dBzetadr,
+            analytic_d2alphadrdtheta,
+            analytic_dalphadr,
+        ) = _circle_analytics(
+            dqdr, q, D, mu0dPdr, r, R0, dpsidr, X, theta, cos_theta, sin_theta, A
+        )
+
+        # f = (1/dpsidr) * dB_zeta/dr
+        analytic["dB_zeta_dr"].append(analytic_dBzetadr)
+        data["dB_zeta_dr"].append(metric_terms.dB_zeta_dr / dpsidr)
+
+        # f = d^2 alpha / dr dtheta
+        analytic["d2alpha_drdtheta"].append(analytic_d2alphadrdtheta)
+        data["d2alpha_drdtheta"].append(metric_terms.d2alpha_drdtheta)
+
+        # f = dalpha / dr
+        analytic["dalpha_dr"].append(analytic_dalphadr)
+        data["dalpha_dr"].append(metric_terms.dalpha_dr)
+
+    # Compare all parameter sets at once, one row per set
+    for key in analytic:
+        assert np.allclose(np.stack(analytic[key]), np.stack(data[key]), atol=1e-4), key
 
 
 # Calculate FF_prime using metric terms, and compare to value from
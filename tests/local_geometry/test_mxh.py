@@ -154,6 +154,77 @@ def test_flux_surface_long_triangularity():
     assert np.isclose(Z[bottom_corner], -4.0, atol=atol)
 
 
+def test_thetaR_harmonics():
+    theta = np.linspace(0, 2 * np.pi, 129)
+    cn = np.array([0.1, -0.2, 0.05, 0.01])
+    sn = np.array([0.0, 0.4, -0.1, 0.02])
+
+    lg = LocalGeometryMXH({"cn": cn, "sn": sn})
+
+    ntheta = np.outer(theta, np.arange(4))
+    expected = theta + np.sum(cn * np.cos(ntheta) + sn * np.sin(ntheta), axis=1)
+
+    assert np.allclose(lg.get_thetaR(theta), expected)
+    # Result doesn't depend on whether harmonics for this grid are cached
+    lg.get_dthetaR_dtheta(theta)
+    assert np.allclose(lg.get_thetaR(theta), expected)
+    assert np.allclose(lg.get_thetaR(theta[::2]), expected[::2])
+    assert lg.get_thetaR(0.5).shape == lg.get_dthetaR_dtheta(0.5).shape == (1,)
+
+    # Modifying the grid in place must not reuse the cached harmonics
+    theta += 0.3
+    ntheta = np.outer(theta, np.arange(4))
+    expected = theta + np.sum(cn * np.cos(ntheta) + sn * np.sin(ntheta), axis=1)
+    assert np.allclose(lg.get_thetaR(theta), expected)
+    n = np.arange(4)
+    expected = 1 + np.sum(n * (sn * np.cos(ntheta) - cn * np.sin(ntheta)), axis=1)
+    assert np.allclose(lg.get_dthetaR_dtheta(theta), expected)
+
+
+@pytest.mark.parametrize(
+    "theta",
+    [
+        np.linspace(0, 2 * np.pi, 257),
+        np.linspace(0.3, 0.3 + 2 * np.pi, 256, endpoint=False),
+        np.linspace(0, 2 * np.pi, 257) + 0.01 * np.sin(np.linspace(0, 2 * np.pi, 257)),
+    ],
+)
+def test_fourier_moments(theta):
+    cn = np.array([0.6, 0.1, 0.0, 0.05])
+    sn = np.array([0.0, 0.0, -0.2, 0.02])
+    # Moments follow the cn[0] = (1/pi) * integral convention
+    weights = np.array([0.5, 1.0, 1.0, 1.0])
+    ntheta = np.outer(theta, np.arange(4))
+    theta_diff = np.sum(weights * (cn * np.cos(ntheta) + sn * np.sin(ntheta)), axis=1)
+
+    lg = LocalGeometryMXH()
+    fit_cn, fit_sn = lg._get_fourier_moments(theta, theta_diff)
+
+    assert np.allclose(fit_cn, cn, atol=1e-6)
+    assert np.allclose(fit_sn, sn, atol=1e-6)
+
+
+def test_shape_coefficients_setters():
+    lg = LocalGeometryMXH()
+    theta = np.linspace(0, 2 * np.pi, 65)
+    lg.get_dthetaR_dtheta(theta)
+
+    lg.delta = 0.5
+    lg.zeta = 0.1
+    assert np.isclose(lg.sn[1], np.arcsin(0.5))
+    assert np.isclose(lg.sn[2], -0.1)
+
+    expected = 1.0 + np.arcsin(0.5) * np.cos(theta) - 0.2 * np.cos(2 * theta)
+    assert np.allclose(lg.get_dthetaR_dtheta(theta), expected)
+
+    # Coefficients can also be edited in place
+    lg.sn[1] = 0.0
+    assert np.isclose(lg.delta, 0.0)
+    expected = 1.0 - 0.2 * np.cos(2 * theta)
+    assert np.allclose(lg.get_dthetaR_dtheta(theta), expected)
+    assert "sn" in lg.keys()
+
+
 def test_default_bunit_over_b0():
     length = 257
     theta = np.linspace(0, 2 * np.pi, length)
@@ -261,6 +332,34 @@ def test_load_from_eq():
     assert all(mxh.theta >= 0)
 
 
+def test_bpol_jacobian():
+    length = 129
+    theta = np.linspace(0, 2 * np.pi, length)
+    miller = generate_miller(
+        theta,
+        dict={"kappa": 2.0, "delta": 0.5, "s_kappa": 0.5, "s_delta": 0.2, "shift": 0.1},
+    )
+
+    mxh = LocalGeometryMXH()
+    mxh.from_local_geometry(miller)
+
+    params = np.array([mxh.shift, mxh.s_kappa, mxh.dZ0dr, *mxh.dcndr, *mxh.dsndr])
+    params += 0.01
+
+    # Central finite differences
+    step = 1e-6
+    finite_difference = np.empty((len(mxh.theta), len(params)))
+    for i in range(len(params)):
+        dparams = np.zeros(len(params))
+        dparams[i] = step
+        finite_difference[:, i] = (
+            mxh.minimise_b_poloidal(params + dparams)
+            - mxh.minimise_b_poloidal(params - dparams)
+        ) / (2 * step)
+
+    assert np.allclose(mxh._bpol_jacobian(params), finite_difference, atol=1e-6)
+
+
 @pytest.mark.parametrize(
     ["parameters", "expected"],
     [
@@ -333,3 +432,51 @@ def test_b_poloidal(parameters, expected):
         expected(theta),
         atol=atol,
     )
+
+
+def test_warm_start_fit():
+    """Refitting from a previous flux surface matches a fit from scratch"""
+    eq = read_equilibrium(template_dir / "test.geqdsk", "GEQDSK")
+
+    warm = LocalGeometryMXH()
+    warm.from_global_eq(eq, 0.45)
+    warm.from_global_eq(eq, 0.5, warm_start=True)
+
+    cold = LocalGeometryMXH()
+    cold.from_global_eq(eq, 0.5)
+
+    for key in ["shift", "s_kappa", "dZ0dr", "dcndr", "dsndr"]:
+        assert np.allclose(warm[key], cold[key], atol=1e-6)
+
+
+def test_numexpr_R_derivatives(monkeypatch):
+    import pyrokinetics.local_geometry.mxh as mxh_module
+
+    pytest.importorskip("numexpr")
+
+    # Dense enough grid to be evaluated with numexpr
+    theta = np.linspace(0, 2 * np.pi, mxh_module._NUMEXPR_MIN_SIZE)
+    lg = LocalGeometryMXH()
+    lg.kappa = 1.5
+    lg.shift = -0.1
+    lg.s_kappa = 0.2
+    lg.dZ0dr = 0.0
+    lg.cn = [0.1, -0.2, 0.05, 0.01]
+    lg.sn = [0.0, 0.4, -0.1, 0.02]
+    lg.dcndr = [0.01, 0.3, -0.02, 0.0]
+    lg.dsndr = [0.0, 0.2, 0.1, -0.05]
+
+    def derivatives():
+        return (
+            *lg.get_RZ_derivatives(theta, normalised=True),
+            *lg.get_RZ_second_derivatives(theta, normalised=True),
+        )
+
+    monkeypatch.setattr(mxh_module, "numexpr", None)
+    expected = derivatives()
+
+    monkeypatch.undo()
+    actual = derivatives()
+
+    for value, expect in zip(actual, expected):
+        assert np.allclose(value, expect)
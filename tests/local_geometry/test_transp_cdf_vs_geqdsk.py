@@ -1,50 +1,22 @@
 import numpy as np
 import pytest
-import warnings
-from pyrokinetics import template_dir
-from pyrokinetics.equilibrium import EquilibriumCOCOSWarning, read_equilibrium
 from pyrokinetics.local_geometry import LocalGeometryMillerTurnbull
 
 
 @pytest.fixture(scope="module")
-def transp_cdf_equilibrium():
-    warnings.simplefilter("ignore", EquilibriumCOCOSWarning)
-    eq = read_equilibrium(template_dir / "transp_eq.cdf", time=0.2)
-    warnings.simplefilter("default", EquilibriumCOCOSWarning)
-    return eq
-
-
-@pytest.fixture(scope="module")
-def transp_gq_equilibrium():
-    warnings.simplefilter("ignore", EquilibriumCOCOSWarning)
-    eq = read_equilibrium(template_dir / "transp_eq.geqdsk")
-    warnings.simplefilter("default", EquilibriumCOCOSWarning)
-    return eq
-
-
-def assert_within_ten_percent(key, cdf_value, gq_value):
-    difference = np.abs((cdf_value - gq_value))
-    smallest_value = np.min(np.abs([cdf_value, gq_value]))
-
-    if smallest_value == 0.0:
-        if difference == 0.0:
-            assert True
-        else:
-            assert (
-                np.abs((cdf_value - gq_value) / np.min(np.abs([cdf_value, gq_value])))
-                < 0.1
-            ), f"{key} not within 10 percent"
-    else:
-        assert difference / smallest_value < 0.5, f"{key} not within 10 percent"
-
-
-def test_compare_transp_cdf_geqdsk(transp_cdf_equilibrium, transp_gq_equilibrium):
-    # TODO Rather than ignoring most attrs, better to explicitly include them
+def miller_geometries(transp_gq_equilibrium, transp_cdf_equilibrium):
+    """Miller-Turnbull fits at ``psi_n=0.5`` to the TRANSP GEQDSK and CDF equilibria"""
     psi_n = 0.5
     lg_gq = LocalGeometryMillerTurnbull()
     lg_cdf = LocalGeometryMillerTurnbull()
     lg_gq.from_global_eq(transp_gq_equilibrium, psi_n=psi_n)
     lg_cdf.from_global_eq(transp_cdf_equilibrium, psi_n=psi_n)
+    return lg_gq, lg_cdf
+
+
+def test_compare_transp_cdf_geqdsk(miller_geometries):
+    # TODO Rather than ignoring most attrs, better to explicitly include them
+    lg_gq, lg_cdf = miller_geometries
 
     ignored_geometry_attrs = [
         "B0",
@@ -72,7 +44,14 @@ def test_compare_transp_cdf_geqdsk(transp_cdf_equilibrium, transp_gq_equilibrium
         "jacob",
     ]
 
-    for key in lg_gq.keys():
-        if key in ignored_geometry_attrs:
-            continue
-        assert_within_ten_percent(key, lg_gq[key], lg_cdf[key])
+    keys = [key for key in lg_gq.keys() if key not in ignored_geometry_attrs]
+    gq_values = np.array([lg_gq[key] for key in keys], dtype=float)
+    cdf_values = np.array([lg_cdf[key] for key in keys], dtype=float)
+
+    difference = np.abs(cdf_values - gq_values)
+    smallest_value = np.minimum(np.abs(cdf_values), np.abs(gq_values))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        within_tolerance = (difference == 0.0) | (difference / smallest_value < 0.5)
+
+    failed = [keys[i] for i in np.flatnonzero(~within_tolerance)]
+    assert not failed, f"{failed} not within tolerance"